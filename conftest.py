@@ -1,9 +1,12 @@
 import asyncio
 import logging
 from contextlib import suppress
+from copy import deepcopy
 
 import pytest
 
+from kiwi_cogs import Machine
+
 logger = logging.getLogger()
 
 
@@ -15,11 +18,14 @@ def exception_handler(_, context):
 def event_loop():
     """Overrides pytest default function scoped event loop
 
-    Implements gracefully cleaning up asyncio tasks.
+    Implements gracefully cleaning up asyncio tasks. Tasks are started eagerly where supported (Python 3.12+),
+    so tasks which complete without suspending are never scheduled on the loop.
     """
     policy = asyncio.get_event_loop_policy()
     loop = policy.new_event_loop()
     loop.set_exception_handler(exception_handler)
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
     yield loop
     print("Gathering tasks to clean up...")
     tasks = asyncio.all_tasks(loop=loop)
@@ -31,3 +37,22 @@ def event_loop():
 
     print("Closing loop...")
     loop.close()
+
+
+@pytest.fixture(scope="session")
+def machine_factory():
+    """Creates machines from a configuration, building each configuration only once per session
+
+    Every call returns a deep copy of the created machine, so tests are free to drive it and change its context.
+    The configuration is kept alongside the machine so its id can not be reused, configuration fixtures should be
+    at least module scoped to benefit from the cache.
+    """
+    cache = {}
+
+    async def make(config: dict) -> Machine:
+        key = id(config)
+        if key not in cache:
+            cache[key] = (config, await Machine.create(config))
+        return deepcopy(cache[key][1])
+
+    return make
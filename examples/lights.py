@@ -1,6 +1,6 @@
 import asyncio
 
-from kiwi_cogs import Machine
+from kiwi_cogs import Machine, install_uvloop
 
 config = {
     "name": "lights",  # the name of this machine
@@ -22,4 +22,5 @@ async def run():
         await machine.event("NEXT")
 
 
+install_uvloop()  # use uvloop when kiwi-cogs[fast] is installed
 asyncio.run(run())
@@ -26,10 +26,8 @@ def check_if_score_is_advantage(context, _):
     :returns: True if the score is advantage for one player, False otherwise
     :rtype: bool
     """
-    if context["player1_score"] > context["player2_score"]:
-        return context["player1_score"] >= 4 and context["player1_score"] - context["player2_score"] == 1
-    else:
-        return context["player2_score"] >= 4 and context["player2_score"] - context["player1_score"] == 1
+    player1, player2 = context["player1_score"], context["player2_score"]
+    return max(player1, player2) >= 4 and abs(player1 - player2) == 1
 
 
 def check_if_score_is_game(context, _):
@@ -41,10 +39,8 @@ def check_if_score_is_game(context, _):
     :returns: True if the score is a game for one player, False otherwise
     :rtype: bool
     """
-    if context["player1_score"] > context["player2_score"]:
-        return context["player1_score"] >= 4 and context["player1_score"] - context["player2_score"] >= 2
-    else:
-        return context["player2_score"] >= 4 and context["player2_score"] - context["player1_score"] >= 2
+    player1, player2 = context["player1_score"], context["player2_score"]
+    return max(player1, player2) >= 4 and abs(player1 - player2) >= 2
 
 
 def increment_player1_score(context, _):
@@ -1,5 +1,19 @@
-from .exceptions import UnknownAction, UnknownGuard, UnknownTarget
+from .context import SlottedContext, slotted_context
+from .exceptions import SyncUnsupported, UnknownAction, UnknownGuard, UnknownTarget
 from .machine import Machine
+from .runtime import install_uvloop
 from .state import StateType
+from .utils import tabulate_guard
 
-__all__ = ["Machine", "UnknownAction", "UnknownGuard", "UnknownTarget", "StateType"]
+__all__ = [
+    "Machine",
+    "install_uvloop",
+    "slotted_context",
+    "SlottedContext",
+    "tabulate_guard",
+    "SyncUnsupported",
+    "UnknownAction",
+    "UnknownGuard",
+    "UnknownTarget",
+    "StateType",
+]
@@ -0,0 +1,82 @@
+from collections.abc import MutableMapping
+from functools import lru_cache
+from keyword import iskeyword
+from typing import Any, Dict, Iterator, Tuple, Type
+
+
+class SlottedContext(MutableMapping):
+    """A context with a slot per key, read and written as attributes or as a dict
+
+    Guards and actions can use `context.points` for faster access, while `context["points"]` keeps
+    working for callables written against a dict context. Keys are fixed when the context is created.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **values: Any) -> None:
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        delattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        keys: Tuple[str, ...] = self.__slots__
+        return (key for key in keys if hasattr(self, key))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__ and hasattr(self, key)  # type: ignore[arg-type]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the generated classes can not be imported by name, so rebuild from the values when copying or pickling
+        return slotted_context, (dict(self.items()),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+_RESERVED = frozenset(dir(SlottedContext))
+"""The attributes of a slotted context, which can not be used as keys"""
+
+
+@lru_cache(maxsize=None)
+def _context_type(keys: Tuple[str, ...]) -> Type[SlottedContext]:
+    """Return the slotted context class for the keys, classes are shared by contexts with the same keys"""
+    return type("SlottedContext", (SlottedContext,), {"__slots__": keys, "__module__": __name__})
+
+
+def slotted_context(values: Dict[str, Any]) -> SlottedContext:
+    """Builds a slotted context from a dict of initial values, to be used as the context of a machine
+
+    :param values: The initial values of the context, its keys are the only keys of the context
+    :type values: Dict[str, Any]
+
+    :raises ValueError: If a key is not an identifier, is a keyword, or is the name of a mapping method
+
+    :returns: The slotted context
+    :rtype: SlottedContext
+    """
+    for key in values:
+        if not isinstance(key, str) or not key.isidentifier() or iskeyword(key):
+            raise ValueError(f"Context key {key!r} is not a valid identifier")
+        if key in _RESERVED:
+            raise ValueError(f"Context key {key!r} would hide the {key} attribute of the context")
+    return _context_type(tuple(values))(**values)
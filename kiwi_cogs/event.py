@@ -1,54 +1,131 @@
-from asyncio import iscoroutinefunction
-from typing import Callable, Dict, List, Optional, Union
+from sys import intern
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
-from pydantic import BaseModel, validator
+from .transition import ALWAYS, Transition
 
-from .transition import Transition
 
+def _single_transition(transition: Transition) -> Callable:
+    """Return a function taking a single transition without actions, the common case, without compiling one
 
-class Event(BaseModel):
-    name: Optional[str] = None
+    :param transition: The transition to take, its condition must not be a coroutine function
+    :type transition: Transition
+
+    :returns: The function taking the context and event
+    :rtype: Callable
+    """
+    cond = transition.cond
+    if cond is ALWAYS:
+
+        def dispatch(context: Any, event: Any) -> Optional[Transition]:
+            return transition
+
+    else:
+
+        def dispatch(context: Any, event: Any) -> Optional[Transition]:
+            return transition if cond(context, event) else None
+
+    return dispatch
+
+
+def compile_transitions(transitions: Sequence[Transition], asynchronous: bool) -> Callable:
+    """Compiles transitions into a single function that takes the first transition whose condition is met
+
+    The function checks each condition in turn and calls the actions of the first met transition with the context
+    and event, returning the transition or None. Unconditional transitions are taken without a check, transitions
+    after them can never be taken and are left out. The synchronous function must only be used when none of the
+    conditions or actions are coroutine functions.
+
+    :param transitions: The transitions to check, in order
+    :type transitions: Sequence[Transition]
+    :param asynchronous: Whether to compile a coroutine function
+    :type asynchronous: bool
+
+    :returns: The compiled function taking the context and event
+    :rtype: Callable
+    """
+    if not asynchronous and len(transitions) == 1 and not transitions[0]._actions:
+        return _single_transition(transitions[0])
+
+    namespace: Dict[str, Any] = {}
+    lines = [f"{'async ' if asynchronous else ''}def dispatch(context, event):"]
+    for index, transition in enumerate(transitions):
+        namespace[f"_t{index}"] = transition
+        body = []
+        for action_index, (action, is_coro) in enumerate(transition._actions):
+            namespace[f"_a{index}_{action_index}"] = action
+            body.append(f"{'await ' if asynchronous and is_coro else ''}_a{index}_{action_index}(context, event)")
+        body.append(f"return _t{index}")
+        if transition.cond is ALWAYS:
+            lines.extend(f"    {line}" for line in body)
+            break
+
+        namespace[f"_c{index}"] = transition.cond
+        lines.append(
+            f"    if {'await ' if asynchronous and transition._cond_is_coro else ''}_c{index}(context, event):"
+        )
+        lines.extend(f"        {line}" for line in body)
+    else:
+        lines.append("    return None")
+    exec("\n".join(lines), namespace)  # noqa: S102
+    dispatch: Callable = namespace["dispatch"]
+    return dispatch
+
+
+class Event:
+    __slots__ = ("name", "transitions", "_all_sync", "_dispatch")
+
+    name: Optional[str]
     """Name of the event"""
-    guards: Optional[Dict[str, Callable]] = None
-    """Possible guards, which are callables"""
-    actions: Optional[Dict[str, Callable]] = None
-    """Action side effects for the machine"""
     transitions: List[Transition]
+    """The transitions for this event, the first whose condition is met is taken"""
+    _all_sync: bool
+    """Whether every transition of this event can be taken without awaiting"""
+    _dispatch: Callable
+    """The transitions compiled into a single function, a coroutine function unless all of them are synchronous"""
 
-    @validator("transitions", pre=True)
-    def build_transitions(cls, value: Union[Dict, List], values: Dict) -> List[Transition]:
-        """Build a list of transitions from the given transition data
+    def __init__(self, name: Optional[str], transitions: List[Transition]) -> None:
+        self.name = name
+        self.transitions = transitions
+        self._all_sync = all(transition._all_sync for transition in transitions)
+        self._dispatch = compile_transitions(transitions, asynchronous=not self._all_sync)
 
-        :param transition_data: The transition data, either a single transition dict or a list of transition dicts
-        :type transition_data: Union[Dict, List]
+    @classmethod
+    def from_config(
+        cls, name: Optional[str], config: List[Dict[str, Any]], cache: Optional[Dict[Any, "Event"]] = None
+    ) -> "Event":
+        """Build an event from the given transition data
 
-        :returns: The list of transitions
-        :rtype: List[Transition]"""
-        guards = values.get("guards")
-        actions = values.get("actions")
-        if isinstance(value, dict):
-            return [Transition(guards=guards, actions_map=actions, **value)]
-        else:
-            return [Transition(guards=guards, actions_map=actions, **transition) for transition in value]
+        Events with the same name and transitions are built once per cache and shared, they hold no state of their
+        own, targets are resolved against the active state when the transition is taken.
 
-    async def execute_actions(self, context: dict, event: str, transition: Transition) -> None:
-        """Execute all of the actions in a transition
+        :param name: The name of the event
+        :type name: Optional[str]
+        :param config: The normalized transition data, a list of transition dicts with resolved callables
+        :type config: List[Dict[str, Any]]
+        :param cache: Previously built events keyed by their name and transitions
+        :type cache: Optional[Dict[Any, Event]]
 
-        :param context: The context of the system
-        :type context: dict
-
-        :param event: The event that triggered the transition
-        :type event: str
+        :returns: The built event
+        :rtype: Event"""
+        key = None
+        if cache is not None:
+            key = (name, tuple((t.get("target"), t["cond"], tuple(t["actions"])) for t in config))
+            try:
+                event = cache.get(key)
+            except TypeError:  # an unhashable callable, the event can not be shared
+                key = event = None
+            if event is not None:
+                return event
 
-        :param transition: The transition that will be executed
-        :type transition: Transition"""
-        for action in transition.actions:
-            if iscoroutinefunction(action):
-                await action(context, event)
-            else:
-                action(context, event)
+        event = cls(
+            name=intern(name) if name is not None else None,  # event names are dict keys on every dispatch
+            transitions=[Transition.from_config(t) for t in config],
+        )
+        if key is not None:
+            cache[key] = event  # type: ignore[index]
+        return event
 
-    async def get_transition(self, context: dict, event: str) -> Optional[Transition]:  # type: ignore[return]
+    async def get_transition(self, context: dict, event: str) -> Optional[Transition]:
         """Return the next transition to take, if a condition is met
 
         :param context: The context of the system
@@ -60,7 +137,6 @@ class Event(BaseModel):
         :returns: The next transition to take, if a condition is met
         :rtype: Optional[Transition]
         """
-        for transition in self.transitions:
-            if transition.cond(context, event):
-                await self.execute_actions(context=context, event=event, transition=transition)
-                return transition
+        if self._all_sync:
+            return self._dispatch(context, event)  # type: ignore[no-any-return]
+        return await self._dispatch(context, event)  # type: ignore[no-any-return]
@@ -8,3 +8,7 @@ class UnknownAction(Exception):
 
 class UnknownGuard(Exception):
     """Guard could not be found"""
+
+
+class SyncUnsupported(Exception):
+    """Machine has coroutine callables and can not be run synchronously"""
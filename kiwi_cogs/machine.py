@@ -1,15 +1,127 @@
+from contextlib import suppress
+from copy import copy, deepcopy
 from logging import Logger, getLogger
-from typing import Any, Callable, Dict, List, Optional, Union
-
-from pydantic import BaseModel, root_validator, validator
+from sys import intern
+from typing import Any, Callable, ClassVar, Coroutine, Dict, Iterable, List, Optional, Tuple
+from warnings import warn
 
 from .event import Event
-from .exceptions import UnknownTarget
+from .exceptions import SyncUnsupported, UnknownTarget
 from .state import State
-from .utils import parse_target
-
+from .transition import ALWAYS, build_cond, load_actions
+from .utils import bind_info, split_target
+
+_LOGGER = getLogger(__name__)
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Coerce a configuration value that may be given as a single item, or not at all, into a list"""
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _normalize_transitions(
+    value: Any, guards: Dict[str, Callable], actions: Dict[str, Callable]
+) -> List[Dict[str, Any]]:
+    """Normalize a single transition, or a list of transitions, into a list of transitions with resolved callables"""
+    return [
+        {
+            **transition,
+            "actions": load_actions(_as_list(transition.get("actions")), actions),
+            "cond": build_cond(transition.get("cond", ALWAYS), guards),
+        }
+        for transition in _as_list(value)
+    ]
+
+
+def _normalize_events(
+    value: Optional[Dict[str, Any]], guards: Dict[str, Callable], actions: Dict[str, Callable]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Normalize the transitions of each event"""
+    return {name: _normalize_transitions(transitions, guards, actions) for name, transitions in (value or {}).items()}
+
+
+def _normalize_states(
+    states: Dict[str, Any], guards: Dict[str, Callable], actions: Dict[str, Callable]
+) -> Dict[str, Any]:
+    """Normalize the configuration of the states, and all of their sub-states, without recursing"""
+    normalized: Dict[str, Any] = {}
+    stack = [(states, normalized)]
+    while stack:
+        configs, target = stack.pop()
+        for name, config in configs.items():
+            state = target[name] = {
+                **config,
+                "states": {},
+                "events": _normalize_events(config.get("events"), guards, actions),
+                "transitions": _normalize_transitions(config.get("transitions"), guards, actions),
+                "entry": load_actions(_as_list(config.get("entry")), actions),
+                "exit": load_actions(_as_list(config.get("exit")), actions),
+            }
+            if config.get("states"):
+                stack.append((config["states"], state["states"]))
+    return normalized
+
+
+def _normalize_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a machine configuration in a single sweep, so that the builders only ever see resolved lists
+
+    Single transitions, actions and entry or exit callables are wrapped in lists, missing values are filled in
+    with empty ones. Named guards and actions, including named entry and exit callables, are resolved to their
+    callables. The passed in configuration is not modified.
+
+    :param config: The machine configuration dictionary
+    :type config: dict
+
+    :raises UnknownGuard: when a named condition can not be found in the guards
+    :raises UnknownAction: when a named action can not be found in the actions
+
+    :returns: The normalized configuration
+    :rtype: dict
+    """
+    guards = config.get("guards") or {}
+    actions = config.get("actions") or {}
+    return {
+        **config,
+        "states": _normalize_states(config["states"], guards, actions),
+        "events": _normalize_events(config.get("events"), guards, actions),
+    }
+
+
+def _copy_items(items: Iterable[Tuple[str, Any]]) -> Tuple[Tuple[str, Any], ...]:
+    """Deep copy the values of context items, values that can not be copied, such as locks, are shared"""
+    copied = []
+    for key, value in items:
+        with suppress(TypeError):
+            value = deepcopy(value)
+        copied.append((key, value))
+    return tuple(copied)
+
+
+def _copy_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a context, keeping its type, with deep copies of its values where they can be copied"""
+    copied = copy(context)  # a dict or a slotted context
+    copied.update(_copy_items(context.items()))
+    return copied
+
+
+class Machine:
+    __slots__ = (
+        "name",
+        "initial",
+        "state",
+        "guards",
+        "actions",
+        "context",
+        "events",
+        "states",
+        "_all_sync",
+        "_targets",
+        "_default_context",
+        "_context",
+    )
 
-class Machine(BaseModel):
     name: str
     """The name for the machine"""
     initial: str
@@ -22,48 +134,102 @@ class Machine(BaseModel):
     """Action side effects for the machine"""
     context: Optional[Dict[str, Any]]
     """The contextual information """
-    events: Optional[Union[Dict[str, Event], List[Event]]] = {}
+    events: Dict[str, Event]
     """The events at the root of the machine"""
     states: Dict[str, State]
     """The possible states for the machine"""
-    logger: Logger = getLogger(__name__)
-    """The logger for the machine"""
-
-    class Config:
-        arbitrary_types_allowed = True
+    logger: ClassVar[Logger] = _LOGGER
+    """The logger for all machines"""
+    _info: ClassVar[Callable[..., None]] = staticmethod(bind_info(_LOGGER))
+    """The logger's info method, or a no-op when INFO is disabled, shared by all machines"""
+    _all_sync: bool
+    """Whether the machine can be driven without awaiting any of its callables"""
+    _targets: Dict[str, Tuple[State, ...]]
+    """Targets starting at a root state, mapped to the states to enter"""
+    _default_context: Optional[Dict[str, Any]]
+    """A deep copy of the configured context, restored by `reset`, None when no context was configured"""
+    _context: Optional[Dict[str, Any]]
+    """The context the machine created, restored in place by `reset`, a context set with `with_context` is not"""
+
+    def __init__(
+        self,
+        name: str,
+        initial: str,
+        states: Dict[str, State],
+        events: Optional[Dict[str, Event]] = None,
+        guards: Optional[Dict[str, Callable]] = None,
+        actions: Optional[Dict[str, Callable]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if not all(isinstance(state, State) for state in states.values()):
+            # `Machine(**config)` built from the configuration while Machine was a pydantic model
+            warn(
+                "Passing a configuration to Machine is deprecated, use Machine.from_config or Machine.create instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            config = {"name": name, "initial": initial, "states": states, "events": events}
+            built = self.from_config({**config, "guards": guards, "actions": actions, "context": context})
+            for slot in Machine.__slots__:
+                setattr(self, slot, getattr(built, slot))
+            return
+
+        self.name = name
+        self.initial = initial
+        self.states = states
+        self.state = states.get(initial)
+        self.events = events if events is not None else {}
+        self.guards = guards
+        self.actions = actions
+        self.context = context
+        self._default_context = _copy_context(context) if context is not None else None
+        self._context = None
+        self._all_sync = all(state._all_sync for state in self.states.values()) and all(
+            event._all_sync for event in self.events.values()
+        )
+        self._resolve_targets()
+        for state in self.states.values():
+            # root events take precedence, merge them into each root state's event table
+            state._outer_events = self.events
+            state._invalidate()
 
-    @validator("states", pre=True)
-    def build_states(cls, value: dict, values: Dict[str, Any]) -> Dict[str, State]:
-        """Builds the states from the passed in states object.
-
-        :param value: The state configuration dictionary.
-        :type value: dict
-
-        :return: The built state objects.
-        :rtype: Dict[str, State]
-        """
-        guards = values.get("guards")
-        actions = values.get("actions")
-        return {name: State(name=name, actions=actions, guards=guards, **val) for name, val in value.items()}
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "Machine":
+        """Builds a machine, and all of its states, events and transitions, from its configuration
 
-    @root_validator
-    def build_initial_state(cls, values: Dict[str, Any]) -> Dict:
-        """Builds the initial state value.
+        The machine is not stepped, transient transitions of the initial state have not been taken.
 
-        :param values: The values passed to the Machine constructor.
-        :type values: Dict
+        :param config: The machine configuration dictionary.
+        :type config: dict
 
-        :return: The updated values.
-        :rtype: Dict
+        :return: The built Machine instance.
+        :rtype: Machine
         """
-        if states := values.get("states"):
-            initial = values["initial"]
-            values["state"] = states.get(initial)
-        # check for transient state and transition?
-        return values
+        config = _normalize_config(config)
+        guards = config.get("guards")
+        actions = config.get("actions")
+        context = config.get("context")
+        cache: Dict[Any, Event] = {}  # identical events are built once and shared across states
+        compiled: Dict[Any, Tuple[Callable, Callable]] = {}  # as are identical entry and exit functions
+        states = (
+            State.from_config(name, value, guards=guards, actions=actions, events=cache, compiled=compiled)
+            for name, value in config["states"].items()
+        )
+        events = (Event.from_config(name, value, cache=cache) for name, value in config["events"].items())
+        machine = cls(
+            name=config["name"],
+            initial=intern(config["initial"]),
+            states={state.name: state for state in states},
+            events={event.name: event for event in events},  # type: ignore[misc]
+            guards=guards,
+            actions=actions,
+            context=copy(context) if context is not None else None,  # a dict or a slotted context
+        )
+        machine._context = machine.context
+        return machine
 
     @classmethod
-    async def create(cls: "Machine", config: dict) -> "Machine":  # type: ignore[misc]
+    async def create(cls, config: dict) -> "Machine":
         """Creates a new instance of the Machine class.
 
         :param config: The machine configuration dictionary.
@@ -72,21 +238,61 @@ class Machine(BaseModel):
         :return: The created Machine instance.
         :rtype: Machine
         """
-        machine = cls(**config)  # type: ignore[operator]
+        machine = cls.from_config(config)
+        machine._bind_logging()  # pick up the logging level at the time of creation
         await machine.step()  # make sure all transient states are executed for initial state
-        return machine  # type: ignore[no-any-return]
+        return machine
 
-    @validator("events", pre=True)
-    def build_events(cls, value: dict) -> Dict[str, Event]:
-        """Build the events
+    def _shared(self) -> Dict[int, Any]:
+        """Return the objects that are never changed once the machine is built, keyed by id
 
-        :param value: The events to be built
-        :type value: dict
+        Used to seed the memo when spawning a machine, so copies share these objects.
 
-        :returns: The built events as a dictionary
-        :rtype: dict
+        :returns: The objects that can be shared between copies of this machine
+        :rtype: Dict[int, Any]
+        """
+        states = [state for root in self.states.values() for state in root.walk()]
+        events = [*self.events.values(), *(event for state in states for event in state.events.values())]
+        shared: List[Any] = [self.events, self.guards, self.actions, *events]
+        shared.extend(transition for event in events for transition in event.transitions)
+        for state in states:
+            shared.extend((state.events, state.transitions, state.entry, state.exit, state._transient))
+            shared.extend(state.transitions)
+        return {id(value): value for value in shared if value is not None}
+
+    def _resolve_targets(self) -> None:
+        """Resolve every path from the root of the machine, and the target of every transition, ahead of dispatch
+
+        Targets starting at a root state are stored as the path of states to enter, other targets
+        are resolved against the active state when the transition is taken.
+
+        :raises: UnknownTarget - If a target can not be found anywhere in the machine
         """
-        return {name: Event(name=name, transitions=val) for name, val in value.items()}
+        states = [state for root in self.states.values() for state in root.walk()]
+        events = [*self.events.values(), *(event for state in states for event in state.events.values())]
+        transitions = [
+            *(transition for event in events for transition in event.transitions),
+            *(transition for state in states for transition in state.transitions),
+        ]
+        # every path from the root is known up front, so any absolute target is a single lookup
+        self._targets = State.build_paths(self.states)
+        for target in (transition.target for transition in transitions):
+            if target is None or target in self._targets:
+                continue
+
+            names = split_target(target)
+            root = self.states.get(names[0])
+            path = root.resolve(names[1:]) if root is not None else None
+            if path is not None:
+                self._targets[target] = (root, *path)  # type: ignore[arg-type]
+            elif root is not None or not any(state.resolve(names) for state in states):
+                raise UnknownTarget(f"Target state {target} can not be found")
+
+    @classmethod
+    def _bind_logging(cls) -> None:
+        """Re-evaluate the logging level for all machines and states"""
+        cls._info = staticmethod(bind_info(cls.logger))
+        State._bind_logging()
 
     def update_config(self, config: dict) -> None:
         """Updates this instances config with the passed in config.
@@ -95,28 +301,136 @@ class Machine(BaseModel):
         :type config: dict
         """
 
-    async def event(self, event: str) -> State:
+    def event(self, name: str) -> Coroutine[Any, Any, State]:
         """Transitions the machine by executing an event
 
-        :param event: The name of the event to trigger
-        :type event: str
+        When none of the machine's callables are coroutine functions the event is executed immediately,
+        and the returned coroutine completes without suspending. Otherwise it is executed when awaited.
+        Either way the result can be awaited, or passed to `asyncio.create_task` and `asyncio.run`.
+
+        :param name: The name of the event to trigger
+        :type name: str
+
+        :returns: A coroutine of the current state of the machine after the transition
+        :rtype: Coroutine[Any, Any, State]
+        """
+        if self._all_sync:
+            self._dispatch_sync(name)
+            return self.state._done  # type: ignore[union-attr]
+        return self.aevent(name)
+
+    async def aevent(self, name: str) -> State:
+        """Transitions the machine by executing an event, as a coroutine
+
+        :param name: The name of the event to trigger
+        :type name: str
 
         :returns: The current state of the machine after the transition
         :rtype: State
         """
-        self.logger.info("Machine processing event: %s", event)
-        event = self.events.get(event) if event in self.events else self.state.get_event(event)  # type: ignore[union-attr, assignment, operator]
-        if event:
-            transition = await event.get_transition(self.context, event)  # type: ignore[attr-defined]
-            if transition:  # there is a transition
-                if transition.target is not None:
-                    await self.do_transition(target=transition.target)  # if the transition has a target set the state
-                await self.step()  # step through the machine as state changed
+        if self._all_sync:
+            self._dispatch_sync(name)
         else:
-            self.logger.error("Event %s not found", event)
+            await self._dispatch(name)
+
+        return self.state  # type: ignore[return-value]
+
+    async def trigger_events(self, events: Iterable[str]) -> State:
+        """Transitions the machine by executing each of the events in order
+
+        Equivalent to calling `event` for each event, transient transitions are still taken between events.
+
+        :param events: The names of the events to trigger
+        :type events: Iterable[str]
+
+        :returns: The current state of the machine after all of the transitions
+        :rtype: State
+        """
+        if self._all_sync:
+            return self.trigger_events_sync(events)
+
+        dispatch = self._dispatch
+        for name in events:
+            await dispatch(name)
+        return self.state  # type: ignore[return-value]
+
+    def trigger_events_sync(self, events: Iterable[str]) -> State:
+        """Transitions the machine by executing each of the events in order without awaiting
+
+        Only available when none of the guards, actions, entry or exit callables of the machine are coroutine functions.
+
+        :param events: The names of the events to trigger
+        :type events: Iterable[str]
+
+        :raises SyncUnsupported: If the machine has coroutine callables
+
+        :returns: The current state of the machine after all of the transitions
+        :rtype: State
+        """
+        if not self._all_sync:
+            raise SyncUnsupported(f"Machine {self.name} has coroutine callables, use `trigger_events` instead")
+
+        dispatch = self._dispatch_sync
+        for name in events:
+            dispatch(name)
+        return self.state  # type: ignore[return-value]
+
+    def event_sync(self, name: str) -> State:
+        """Transitions the machine by executing an event without awaiting
+
+        Only available when none of the guards, actions, entry or exit callables of the machine are coroutine functions.
+
+        :param name: The name of the event to trigger
+        :type name: str
+
+        :raises SyncUnsupported: If the machine has coroutine callables
+
+        :returns: The current state of the machine after the transition
+        :rtype: State
+        """
+        if not self._all_sync:
+            raise SyncUnsupported(f"Machine {self.name} has coroutine callables, use `event` instead")
 
+        self._dispatch_sync(name)
         return self.state  # type: ignore[return-value]
 
+    async def _dispatch(self, name: str) -> None:
+        """Execute an event and step through the machine
+
+        :param name: The name of the event to trigger
+        :type name: str
+        """
+        self._info("Machine processing event: %s", name)
+        event = self.state._get_event_index().get(name)  # type: ignore[union-attr]
+        if event is None:
+            self.logger.error("Event %s not found", name)
+            return
+
+        transition = await event.get_transition(self.context, name)  # type: ignore[arg-type]
+        if transition:  # there is a transition
+            if transition.target is not None:
+                await self.do_transition(target=transition.target)  # if the transition has a target set the state
+            await self.step()  # step through the machine as state changed
+
+    def _dispatch_sync(self, name: str) -> None:
+        """Execute an event and step through the machine, mirrors `_dispatch` for machines without coroutines
+
+        :param name: The name of the event to trigger
+        :type name: str
+        """
+        self._info("Machine processing event: %s", name)
+        event = self.state._get_event_index().get(name)  # type: ignore[union-attr]
+        if event is None:
+            self.logger.error("Event %s not found", name)
+            return
+
+        # the machine has no coroutines, so the compiled dispatch of the event is called directly
+        transition = event._dispatch(self.context, name)
+        if transition:
+            if transition.target is not None:
+                self._do_transition_sync(transition.target)
+            self._step_sync()
+
     async def step(self, state: Optional[State] = None) -> State:
         """Step through the machine until no more transitions to move through
 
@@ -126,15 +440,38 @@ class Machine(BaseModel):
         :returns: The final state after all possible transitions have been processed
         :rtype: State
         """
+        if self._all_sync:
+            return self._step_sync(state)
+
         if state is None:
             state = self.state
 
-        transition = await self.state.get_transition(context=self.context)  # type: ignore[union-attr , arg-type]
-        if transition and transition.target is not None:
+        while True:
+            transition = await self.state.get_transition(context=self.context)  # type: ignore[union-attr , arg-type]
+            if transition is None or transition.target is None:
+                return state  # type: ignore[return-value]
             await self.do_transition(transition.target)
-            return await self.step()  # step through the new state
+            state = self.state  # step through the new state
+
+    def _step_sync(self, state: Optional[State] = None) -> State:
+        """Step through the machine without awaiting, mirrors `step` for machines without coroutines
 
-        return state  # type: ignore[return-value]
+        :param state: The state to start the step process from, defaults to the current state of the machine
+        :type state: Optional[State], optional
+
+        :returns: The final state after all possible transitions have been processed
+        :rtype: State
+        """
+        if state is None:
+            state = self.state
+
+        context = self.context
+        while True:
+            transition = self.state._get_transition_sync(context)  # type: ignore[union-attr, arg-type]
+            if transition is None or transition.target is None:
+                return state  # type: ignore[return-value]
+            self._do_transition_sync(transition.target)
+            state = self.state
 
     async def on_entry(self, context: dict) -> None:
         """Perform any entry actions for the new state
@@ -142,7 +479,11 @@ class Machine(BaseModel):
         :param context: The context data for the current state
         :type context: dict
         """
-        await self.state.on_entry(context)  # type: ignore[union-attr]
+        state = self.state
+        if state._all_sync:  # type: ignore[union-attr]
+            state._on_entry_sync(context)  # type: ignore[union-attr]
+        else:
+            await state.on_entry(context)  # type: ignore[union-attr]
 
     async def on_exit(self, context: dict) -> None:
         """Perform any exit actions for the current state
@@ -150,28 +491,49 @@ class Machine(BaseModel):
         :param context: The context data for the current state
         :type context: dict
         """
-        await self.state.on_exit(context)  # type: ignore[union-attr]
+        state = self.state
+        if state._all_sync:  # type: ignore[union-attr]
+            state._on_exit_sync(context)  # type: ignore[union-attr]
+        else:
+            await state.on_exit(context)  # type: ignore[union-attr]
 
     async def update_state(self, target: str) -> bool:
         """Update the current state to the target state
 
         :raises: UnknownTarget - If the target state can not be found
         """
-        target_state, remainder = parse_target(target=target)
-        state = self.states.get(target_state)
-        if state is None:
-            # if the state is target state is None pass to child state to handle
+        path = self._targets.get(target)
+        if path is None:
+            # the target is not at the root, pass to child state to handle
             if await self.state.update_state(target, self.context) is None:  # type: ignore[union-attr, arg-type]
                 raise UnknownTarget("Target state can not be found")
             return False
-        else:
-            if self.state:
-                await self.on_exit(self.context)  # type: ignore[arg-type]
-            self.state = state
-            if remainder and remainder != target_state:
-                # consume the rest of the path!
-                await self.state.update_state(remainder, self.context)  # type: ignore[arg-type]
-            return True
+
+        if self.state:
+            await self.on_exit(self.context)  # type: ignore[arg-type]
+        self.state = path[0]
+        for parent, state in zip(path, path[1:]):
+            # consume the rest of the path!
+            await parent.switch_state(state, self.context)  # type: ignore[arg-type]
+        return True
+
+    def _update_state_sync(self, target: str) -> bool:
+        """Update the current state to the target state, mirrors `update_state` for machines without coroutines
+
+        :raises: UnknownTarget - If the target state can not be found
+        """
+        path = self._targets.get(target)
+        if path is None:
+            if self.state._update_state_sync(target, self.context) is None:  # type: ignore[union-attr, arg-type]
+                raise UnknownTarget("Target state can not be found")
+            return False
+
+        if self.state:
+            self.state._on_exit_sync(self.context)  # type: ignore[arg-type]
+        self.state = path[0]
+        for parent, state in zip(path, path[1:]):
+            parent._switch_state_sync(state, self.context)  # type: ignore[arg-type]
+        return True
 
     async def do_transition(self, target: str) -> None:
         """Set a state from a target
@@ -184,6 +546,15 @@ class Machine(BaseModel):
 
         return None
 
+    def _do_transition_sync(self, target: str) -> None:
+        """Set a state from a target, mirrors `do_transition` for machines without coroutines
+
+        :param target: The name of the state to transition to
+        :type target: str
+        """
+        if self._update_state_sync(target):
+            self.state._on_entry_sync(self.context)  # type: ignore[union-attr, arg-type]
+
     async def with_context(self, context: dict) -> State:
         """Update the context and step through the machine
 
@@ -196,6 +567,53 @@ class Machine(BaseModel):
         self.context = context  # update the context
         return await self.step()  # step through the machine
 
+    async def reset(self) -> State:
+        """Return the machine to the state it was in when it was created
+
+        Deep copies of the configured context values are restored in place when the machine created its context,
+        a context set with `with_context` belongs to the caller and is replaced by a new one instead. Values that
+        can not be deep copied are shared. No entry or exit callables are called, the transient transitions of the
+        initial state are taken as they are when the machine is created.
+
+        :returns: The final state after all possible transitions have been processed
+        :rtype: State
+        """
+        for root in self.states.values():
+            for state in root.walk():
+                state.state = None
+                state._event_index = None
+                state._value = None
+
+        if self._default_context is None:
+            self.context = self._context = None
+        elif self.context is not None and self.context is self._context:
+            self.context.clear()
+            self.context.update(_copy_items(self._default_context.items()))
+        else:
+            self.context = self._context = _copy_context(self._default_context)
+
+        self.state = self.initial_state
+        return await self.step()
+
+    async def spawn(self) -> "Machine":
+        """Create a new machine from this one, in the state this machine was in when it was created
+
+        The events, transitions, guards, actions and compiled callables are shared with this machine, only the
+        states and the context are copied. This is faster than building a machine from the same configuration
+        again, keep a machine built with `from_config` or `create` around as a template to spawn machines from.
+
+        :returns: The new machine
+        :rtype: Machine
+        """
+        memo = self._shared()
+        # the context may hold values that can not be copied, such as locks, reset builds the copy's own context
+        memo[id(self.context)] = memo[id(self._context)] = None
+        memo[id(self._default_context)] = self._default_context  # never changed, only copied from
+        machine = deepcopy(self, memo)
+        machine._bind_logging()  # pick up the logging level at the time of creation
+        await machine.reset()
+        return machine
+
     @property
     def initial_state(self) -> State:
         """Get the initial state of the machine
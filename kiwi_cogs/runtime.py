@@ -0,0 +1,20 @@
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """Installs uvloop as the asyncio event loop policy, if it is available
+
+    uvloop is installed with the `fast` extra, `pip install kiwi-cogs[fast]`.
+    Call this at process start, before the event loop is created.
+
+    :returns: True if uvloop was installed, False if it is not available
+    :rtype: bool
+    """
+    try:
+        import uvloop  # type: ignore[import]
+    except ImportError:
+        return False
+
+    # `uvloop.install` is deprecated from Python 3.12, set the policy directly
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
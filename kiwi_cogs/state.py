@@ -1,16 +1,18 @@
-import asyncio
+from asyncio import iscoroutinefunction
 from enum import Enum
 from logging import Logger, getLogger
-from typing import Any, Callable, Dict, List, Optional, Union
-
-from pydantic import BaseModel, root_validator, validator
+from sys import intern
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 from .event import Event
 from .transition import Transition
-from .utils import parse_target
+from .utils import Done, bind_info, compile_callables, parse_target, split_target
 
 ALWAYS = "always"
 
+_LOGGER = getLogger(__name__)
+
 
 class StateType(str, Enum):
     atomic = "atomic"
@@ -19,65 +21,207 @@ class StateType(str, Enum):
     transient = "transient"
 
 
-class State(BaseModel):
-    type: Optional[StateType]  # noqa: A003
+class State:
+    __slots__ = (
+        "type",
+        "name",
+        "state",
+        "entry",
+        "exit",
+        "parent",
+        "initial",
+        "guards",
+        "actions",
+        "transitions",
+        "states",
+        "events",
+        "_parent_state",
+        "_event_index",
+        "_outer_events",
+        "_paths",
+        "_transient",
+        "_value",
+        "_values",
+        "_entry",
+        "_exit",
+        "_entry_sync",
+        "_exit_sync",
+        "_all_sync",
+        "_done",
+    )
+
+    type: StateType  # noqa: A003
     """The type of state this is"""
     name: str
     """The name for this state"""
-    state: Optional["State"] = None
+    state: Optional["State"]
     """The sub-state for this state"""
-    entry: List[Callable] = []
+    entry: Tuple[Callable, ...]
     """Callables to call when entering this state"""
-    exit: List[Callable] = []  # noqa: A003
+    exit: Tuple[Callable, ...]  # noqa: A003
     """Callables to call when exiting this state"""
-    parent: Optional[str] = "."
+    parent: str
     """The parent of this state"""
-    initial: Optional[str] = None
+    initial: Optional[str]
     """The name of the initial sub-state for this state"""
     guards: Optional[Dict[str, Callable]]
     """Possible guards, which are callables"""
     actions: Optional[Dict[str, Callable]]
     """Action side effects for the machine"""
-    transitions: List[Transition] = []
+    transitions: List[Transition]
     """Transient transitions to call when stepping through the state"""
-    states: Optional[Dict[str, "State"]] = {}
+    states: Dict[str, "State"]
     """All possible state for this state"""
-    events: Optional[Union[Dict[str, Event], List[Event]]] = {}
+    events: Dict[str, Event]
     """Possible events to execute for this state"""
-    logger: Logger = getLogger(__name__)
-
-    class Config:
-        arbitrary_types_allowed = True
-
-    @validator("states", pre=True)
-    def build_states(cls, value: dict, values: dict) -> Dict[str, "State"]:
-        """Build the states from the passed in states object
-
-        :param value: The states object to be built
-        :type value: dict
-
-        :returns: The built states as a dictionary
-        :rtype: dict
+    logger: ClassVar[Logger] = _LOGGER
+    """The logger for all states"""
+    _info: ClassVar[Callable[..., None]] = staticmethod(bind_info(_LOGGER))
+    """The logger's info method, or a no-op when INFO is disabled, shared by all states"""
+    _parent_state: Optional["State"]
+    """The parent state object, None for states at the root of the machine"""
+    _event_index: Optional[Dict[str, Event]]
+    """Events reachable from this state and its active sub-states, built on first lookup"""
+    _outer_events: Dict[str, Event]
+    """Events that take precedence over the events of this state, the machine's events for states at the root"""
+    _paths: Dict[str, Tuple["State", ...]]
+    """Every dotted path below this state, mapped to the sub-states it enters"""
+    _transient: Tuple[Tuple[Callable, bool, Transition], ...]
+    """The conditions of the transient transitions, paired with whether they are coroutine functions"""
+    _value: Optional[Union[str, Mapping[str, Any]]]
+    """The value of this state and its active sub-states, built on first access"""
+    _values: Dict[int, Mapping[str, Any]]
+    """The read-only values built for this state, keyed by the id of the active sub-state's value"""
+    _entry: Callable[[dict], Awaitable[None]]
+    """The entry callables combined into a single coroutine function"""
+    _exit: Callable[[dict], Awaitable[None]]
+    """The exit callables combined into a single coroutine function"""
+    _entry_sync: Callable[[dict], None]
+    """The entry callables combined into a single function, raises SyncUnsupported if any are coroutine functions"""
+    _exit_sync: Callable[[dict], None]
+    """The exit callables combined into a single function, raises SyncUnsupported if any are coroutine functions"""
+    _all_sync: bool
+    """Whether this state and all of its sub-states can be driven without awaiting"""
+    _done: Done
+    """A completed awaitable of this state, returned for events that finish without awaiting"""
+
+    def __init__(
+        self,
+        name: str,
+        states: Optional[Dict[str, "State"]] = None,
+        events: Optional[Dict[str, Event]] = None,
+        transitions: Optional[List[Transition]] = None,
+        entry: Optional[Sequence[Callable]] = None,
+        exit: Optional[Sequence[Callable]] = None,  # noqa: A002
+        initial: Optional[str] = None,
+        parent: str = ".",
+        guards: Optional[Dict[str, Callable]] = None,
+        actions: Optional[Dict[str, Callable]] = None,
+        compiled: Optional[Dict[Any, Tuple[Callable, Callable]]] = None,
+    ) -> None:
+        self.name = name
+        self.state = None
+        self.states = states if states is not None else {}
+        self.events = events if events is not None else {}
+        self.transitions = transitions if transitions is not None else []
+        self.entry = tuple(entry) if entry is not None else ()
+        self.exit = tuple(exit) if exit is not None else ()
+        self.initial = initial
+        self.parent = parent
+        self.guards = guards
+        self.actions = actions
+        self.type = self.build_type(self.states, self.events, self.transitions)
+        self._parent_state = None
+        self._event_index = None
+        self._outer_events = {}
+        self._value = None
+        self._values = {}
+        self._entry, self._entry_sync = compile_callables(self.entry, "entry", compiled)
+        self._exit, self._exit_sync = compile_callables(self.exit, "exit", compiled)
+        self._all_sync = (
+            not any(iscoroutinefunction(func) for func in (*self.entry, *self.exit))
+            and all(transition._all_sync for transition in self.transitions)
+            and all(event._all_sync for event in self.events.values())
+            and all(state._all_sync for state in self.states.values())
+        )
+        self._paths = self.build_paths(self.states)
+        self._done = Done(self)
+        self._transient = tuple(
+            (transition.cond, transition._cond_is_coro, transition) for transition in self.transitions
+        )
+        for state in self.states.values():
+            state._parent_state = self
+
+    @classmethod
+    def from_config(
+        cls,
+        name: str,
+        config: Dict[str, Any],
+        guards: Optional[Dict[str, Callable]] = None,
+        actions: Optional[Dict[str, Callable]] = None,
+        parent: str = ".",
+        events: Optional[Dict[Any, Event]] = None,
+        compiled: Optional[Dict[Any, Tuple[Callable, Callable]]] = None,
+    ) -> "State":
+        """Build a state, and all of its sub-states, from its configuration
+
+        :param name: The name of the state
+        :type name: str
+        :param config: The normalized state configuration, with resolved callables
+        :type config: Dict[str, Any]
+        :param guards: Possible guards, which are callables
+        :type guards: Optional[Dict[str, Callable]]
+        :param actions: Action side effects for the machine
+        :type actions: Optional[Dict[str, Callable]]
+        :param parent: The path of the parent state
+        :type parent: str
+        :param events: Previously built events that identical events are shared with
+        :type events: Optional[Dict[Any, Event]]
+        :param compiled: Previously compiled entry and exit functions that identical callables share
+        :type compiled: Optional[Dict[Any, Tuple[Callable, Callable]]]
+
+        :returns: The built state
+        :rtype: State
         """
-        current_name = values.get("name")
-        parent_name = values.get("parent")
-        guards = values.get("guards")
-        actions = values.get("actions")
-        formatted_parent = f"{parent_name}{'.' if parent_name != '.' else ''}{current_name}"
-
-        return {
-            name: State(
-                name=name,
+        # collect the state and all of its sub-states in a single pass, each parent ahead of its sub-states
+        nodes: List[Tuple[str, Dict[str, Any], str, int]] = [(intern(name), config, parent, -1)]
+        for index, (node_name, node_config, node_parent, _) in enumerate(nodes):
+            path = f"{node_parent}{'.' if node_parent != '.' else ''}{node_name}"
+            # state names are dict keys on every transition
+            nodes.extend((intern(child), value, path, index) for child, value in node_config["states"].items())
+
+        # then build them in reverse, so that every sub-state is built before its parent
+        if compiled is None:
+            compiled = {}
+        children: List[List[State]] = [[] for _ in nodes]
+        for index in range(len(nodes) - 1, -1, -1):
+            node_name, node_config, node_parent, parent_index = nodes[index]
+            initial = node_config.get("initial")
+            built = (Event.from_config(event, value, cache=events) for event, value in node_config["events"].items())
+            state = cls(
+                name=node_name,
+                states={child.name: child for child in reversed(children[index])},
+                events={event.name: event for event in built},  # type: ignore[misc]
+                transitions=cls.build_transitions(node_config["transitions"]),
+                entry=node_config["entry"],
+                exit=node_config["exit"],
+                initial=intern(initial) if initial is not None else None,
+                parent=node_parent,
                 guards=guards,
                 actions=actions,
-                parent=formatted_parent,
-                **val,
+                compiled=compiled,
             )
-            for name, val in value.items()
-        }
+            if parent_index >= 0:
+                children[parent_index].append(state)
+        return state
+
+    @classmethod
+    def _bind_logging(cls) -> None:
+        """Re-evaluate the logging level for all states"""
+        cls._info = staticmethod(bind_info(cls.logger))
 
-    @root_validator
-    def build_type(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def build_type(states: Dict[str, "State"], events: Dict[str, Event], transitions: List[Transition]) -> StateType:
         """Builds the type based on the values passed in
 
         - Compound is defined as having sub-states.
@@ -85,85 +229,95 @@ class State(BaseModel):
         - Transient is defined as only having transitions
         - Final is defined as having no further state changes
         """
-        states = values.get("states")
-        transitions = values.get("transitions")
-        events = values.get("events")
-        _type = None
         if states:
-            _type = StateType.compound
+            return StateType.compound
         elif events:
-            _type = StateType.atomic
+            return StateType.atomic
         elif transitions:
-            _type = StateType.transient
-        else:
-            _type = StateType.final
-
-        values["type"] = _type
-        return values
+            return StateType.transient
+        return StateType.final
 
-    @validator("events", pre=True)
-    def build_events(cls, value: dict, values: Dict[str, Any]) -> Dict[str, Event]:
-        """Build the events
-
-        :param value: The events to be built
-        :type value: dict
-
-        :returns: The built events as a dictionary
-        :rtype: dict
-        """
-        guards = values.get("guards")
-        actions = values.get("actions")
-        return {name: Event(name=name, guards=guards, actions=actions, transitions=val) for name, val in value.items()}
-
-    @validator("transitions", pre=True)
-    def build_transitions(cls, value: Optional[list], values: dict) -> List[Transition]:
+    @staticmethod
+    def build_transitions(value: List[Dict[str, Any]]) -> List[Transition]:
         """Build the always transient transitions
 
-        :param value: The transitions to be built
-        :type value: Optional[list]
+        :param value: The normalized transitions to be built, with resolved callables
+        :type value: List[Dict[str, Any]]
 
         :returns: The built transitions as a list
         :rtype: list
         """
-        guards = values.get("guards")
-        actions = values.get("actions")
-        if isinstance(value, dict):
-            return [Transition(target=value["target"], guards=guards, actions_map=actions)]
-        else:
-            return [Transition(guards=guards, actions_map=actions, **transition) for transition in value]  # type: ignore[union-attr]
+        return [Transition.from_config(transition) for transition in value]
 
-    @validator("entry", pre=True)
-    def build_entry(cls, value: Optional[list]) -> List[Callable]:
-        """Setup the entry callables
+    @staticmethod
+    def build_paths(states: Dict[str, "State"]) -> Dict[str, Tuple["State", ...]]:
+        """Build the lookup of every dotted path below a state, from the already built paths of its sub-states
 
-        :param value: The callables to be set up
-        :type value: Optional[list]
+        Paths are included with and without a leading dot, only when parsing the path as a target would
+        enter exactly the states along it.
 
-        :returns: The set up callables as a list
-        :rtype: list
+        :param states: The sub-states of the state
+        :type states: Dict[str, State]
+
+        :returns: The sub-states to enter keyed by dotted path
+        :rtype: Dict[str, Tuple[State, ...]]
         """
-        return [value] if callable(value) else value  # type: ignore[return-value, list-item]
+        paths: Dict[str, Tuple[State, ...]] = {}
+        for state in states.values():
+            candidates: List[Tuple[str, Tuple[State, ...]]] = [(state.name, (state,))]
+            candidates.extend(
+                (f"{state.name}.{key}", (state, *path)) for key, path in state._paths.items() if key[0] != "."
+            )
+            for key, path in candidates:
+                if split_target(key) == tuple(sub_state.name for sub_state in path):
+                    paths[intern(key)] = paths[intern(f".{key}")] = path
+        return paths
 
-    @validator("exit", pre=True)
-    def build_exit(cls, value: Optional[list]) -> List[Callable]:
-        """Setup the exit callables
+    @property
+    def value(self) -> Union[str, Mapping[str, Any]]:
+        """Return the value of the state
 
-        :param value: The callables to be set up
-        :type value: Optional[list]
+        The value of a compound state is a read-only mapping, the same mapping is returned whenever the same
+        sub-states are active.
 
-        :returns: The set up callables as a list
-        :rtype: list
+        :returns: The name of the state, or a mapping of the name to the value of the active sub-state
+        :rtype: Union[str, Mapping[str, Any]]
         """
-        return [value] if callable(value) else value  # type: ignore[return-value, list-item]
+        value = self._value
+        if value is None:
+            if self.state is None:
+                value = self.name
+            else:
+                # sub-state values are canonical, and kept alive by the sub-state, so their id identifies them
+                child = self.state.value
+                value = self._values.get(id(child))
+                if value is None:
+                    value = self._values[id(child)] = MappingProxyType({self.name: child})
+            self._value = value
+        return value
 
     @property
-    def value(self) -> Union[str, Dict[str, Any]]:
-        """Return the value of the state
+    def plain_value(self) -> Union[str, Dict[str, Any]]:
+        """Return the value of the state built from plain dicts, for callers that need a `dict`, such as `json.dumps`
 
-        :returns: The name of the state
-        :rtype: str
+        A new value is built on every access.
+
+        :returns: The name of the state, or a dict of the name to the plain value of the active sub-state
+        :rtype: Union[str, Dict[str, Any]]
         """
-        return {self.name: self.state.value} if self.state else self.name
+        if self.state is None:
+            return self.name
+        return {self.name: self.state.plain_value}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the cached values hold mapping proxies, which can not be copied, copies rebuild them on first access
+        return {slot: getattr(self, slot) for slot in self.__slots__ if slot not in ("_value", "_values")}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._value = None
+        self._values = {}
 
     def get_event(self, name: str) -> Optional[Event]:
         """Return event for the name
@@ -174,15 +328,31 @@ class State(BaseModel):
         :returns: The event with the given name
         :rtype: Event
         """
-        self.logger.info("State %s finding event %s", self.name, name)
-        event = self.events.get(name)  # type: ignore[union-attr]
-        if event is None and self.state:  # this state does not have the event!
-            # check the current child state of for this event
-            self.logger.info("%s found event %s", self.name, name)
-            event = self.state.get_event(name=name)
-        else:
-            self.logger.info("State %s found event %s", self.name, name)
-        return event
+        return self._get_event_index().get(name)
+
+    def _get_event_index(self) -> Dict[str, Event]:
+        """Return the events reachable from this state, building the index if it has been invalidated
+
+        Events of this state take precedence over the events of the active sub-states, the outer events
+        take precedence over both.
+
+        :returns: The event index keyed by event name
+        :rtype: Dict[str, Event]
+        """
+        if self._event_index is None:
+            index = dict(self.state._get_event_index()) if self.state else {}
+            index.update(self.events)
+            index.update(self._outer_events)
+            self._event_index = index
+        return self._event_index
+
+    def _invalidate(self) -> None:
+        """Drop the cached event index and value of this state and all of its ancestors"""
+        state: Optional[State] = self
+        while state is not None:
+            state._event_index = None
+            state._value = None
+            state = state._parent_state
 
     async def on_entry(self, context: dict) -> None:
         """Called when the state is entered
@@ -193,13 +363,30 @@ class State(BaseModel):
         :param context: A dictionary that contains the current context of the system
         :type context: dict
         """
-        self.logger.info("Entering %s state in %s parent", self.name, self.parent)
-        await self._process_callables(self.entry, context)  # state entered so process entry handlers
+        self._info("Entering %s state in %s parent", self.name, self.parent)
+        await self._entry(context)  # state entered so process entry handlers
         if self.states and not self.state:  # if there sub-states they should be processed!
             self.state = self.states.get(str(self.initial))  # set the initial state
+            self._invalidate()
+
+            # call the state's on_entry to setup any further sub-states, without a coroutine if it has none
+            if self.state._all_sync:  # type: ignore[union-attr]
+                self.state._on_entry_sync(context)  # type: ignore[union-attr]
+            else:
+                await self.state.on_entry(context=context)  # type: ignore[union-attr]
 
-            # call the state's on_entry to setup any further sub-states
-            await self.state.on_entry(context=context)  # type: ignore[union-attr]
+    def _on_entry_sync(self, context: dict) -> None:
+        """Called when the state is entered, mirrors `on_entry` for states without coroutines
+
+        :param context: A dictionary that contains the current context of the system
+        :type context: dict
+        """
+        self._info("Entering %s state in %s parent", self.name, self.parent)
+        self._entry_sync(context)
+        if self.states and not self.state:
+            self.state = self.states.get(str(self.initial))
+            self._invalidate()
+            self.state._on_entry_sync(context=context)  # type: ignore[union-attr]
 
     async def on_exit(self, context: dict) -> None:
         """Called when a state is exited
@@ -207,71 +394,207 @@ class State(BaseModel):
         :param context: A dictionary that contains the current context of the system
         :type context: dict
         """
-        self.logger.info("Exiting %s state in %s parent", self.name, self.parent)
-        await self._process_callables(self.exit, context)
+        self._info("Exiting %s state in %s parent", self.name, self.parent)
+        await self._exit(context)
         if self.state:
-            await self.state.on_exit(context=context)  # call the sub-state's on_exit to exit any sub-states
+            # call the sub-state's on_exit to exit any sub-states
+            if self.state._all_sync:
+                self.state._on_exit_sync(context)
+            else:
+                await self.state.on_exit(context=context)
             self.state = None  # reset the stored state upon exiting
+            self._invalidate()
 
-    async def _process_callables(self, callables: List[Callable], context: dict) -> None:
-        """Process the given callables with the given context
+    def _on_exit_sync(self, context: dict) -> None:
+        """Called when a state is exited, mirrors `on_exit` for states without coroutines
 
         :param context: A dictionary that contains the current context of the system
         :type context: dict
-        :param callables: A dictionary that contains the current context of the system
-        :type callables: List[Callable]
         """
-        for func in callables:
-            if asyncio.iscoroutinefunction(func):
-                await func(context)
-            else:
-                func(context)
+        self._info("Exiting %s state in %s parent", self.name, self.parent)
+        self._exit_sync(context)
+        if self.state:
+            self.state._on_exit_sync(context=context)
+            self.state = None
+            self._invalidate()
 
     async def update_state(self, target: str, context: dict) -> Optional["State"]:
         """Update the current state to the target state
 
         :raises: UnknownTarget - If the target state can not be found
         """
-        target_state, remainder = parse_target(target=target)
+        path = self._paths.get(target)
+        if path is not None:  # a path below this state, enter each state along it
+            parent = self
+            for child in path:
+                await parent.switch_state(child, context=context)
+                parent = child
+            return path[0]
+
+        target_state, remainder = parse_target(target)
 
-        state = self.states.get(target_state)  # type: ignore[union-attr]
+        state = self.states.get(target_state)
         if state is None:  # noqa: SIM102
             # if there is a sub-state then pass this onto the next state
             if self.state:
                 return await self.state.update_state(target=target, context=context)
         else:
-            if self.state:  # exiting state
+            await self.switch_state(state, context=context)
+            if remainder and remainder != target_state:
+                await state.update_state(target=remainder, context=context)
+            return state
+
+        return None
+
+    async def switch_state(self, state: "State", context: dict) -> None:
+        """Exit the current sub-state and enter the given sub-state
+
+        :param state: The sub-state to enter
+        :type state: State
+        :param context: A dictionary that contains the current context of the system
+        :type context: dict
+        """
+        if self.state:  # exiting state
+            if self.state._all_sync:
+                self.state._on_exit_sync(context)
+            else:
                 await self.state.on_exit(context=context)
-            self.state = state
-            await self.state.on_entry(context)
+        self.state = state
+        self._invalidate()
+        if state._all_sync:
+            state._on_entry_sync(context)
+        else:
+            await state.on_entry(context)
+
+    def _update_state_sync(self, target: str, context: dict) -> Optional["State"]:
+        """Update the current state to the target state, mirrors `update_state` for states without coroutines"""
+        path = self._paths.get(target)
+        if path is not None:
+            parent = self
+            for child in path:
+                parent._switch_state_sync(child, context=context)
+                parent = child
+            return path[0]
+
+        target_state, remainder = parse_target(target)
+
+        state = self.states.get(target_state)
+        if state is None:  # noqa: SIM102
+            if self.state:
+                return self.state._update_state_sync(target=target, context=context)
+        else:
+            self._switch_state_sync(state, context=context)
             if remainder and remainder != target_state:
-                await self.state.update_state(target=remainder, context=context)
+                state._update_state_sync(target=remainder, context=context)
             return state
 
         return None
 
-    async def get_transition(self, context: dict) -> Optional[Transition]:  # type: ignore[return]
+    def _switch_state_sync(self, state: "State", context: dict) -> None:
+        """Exit the current sub-state and enter the given sub-state, mirrors `switch_state` for states without coroutines
+
+        :param state: The sub-state to enter
+        :type state: State
+        :param context: A dictionary that contains the current context of the system
+        :type context: dict
+        """
+        if self.state:
+            self.state._on_exit_sync(context=context)
+        self.state = state
+        self._invalidate()
+        state._on_entry_sync(context)
+
+    def resolve(self, names: Tuple[str, ...]) -> Optional[Tuple["State", ...]]:
+        """Resolve a path of sub-state names below this state
+
+        :param names: The names of the sub-states, outermost first
+        :type names: Tuple[str, ...]
+
+        :returns: The sub-states the path passes through, or None if the path does not exist
+        :rtype: Optional[Tuple[State, ...]]
+        """
+        path = []
+        state = self
+        for name in names:
+            child = state.states.get(name)
+            if child is None:
+                return None
+            path.append(child)
+            state = child
+        return tuple(path)
+
+    def walk(self) -> Iterator["State"]:
+        """Iterate over this state and all of its sub-states, depth first
+
+        :returns: An iterator over the states
+        :rtype: Iterator[State]
+        """
+        stack = [self]
+        while stack:
+            state = stack.pop()
+            yield state
+            stack.extend(reversed(list(state.states.values())))
+
+    async def get_transition(self, context: dict) -> Optional[Transition]:
         """Check the conditions for each transition of the given state
 
+        Active sub-states are processed first, deepest first, a sub-state transition with a target
+        is applied by its parent before the parent's own transitions are checked.
+
         :param context: A dictionary that contains the current context of the system
         :type context: dict
 
         :returns: The next transition to take, if a condition is met
         :rtype: Optional[Transition]
         """
+        active = [self]
+        while active[-1].state:
+            active.append(active[-1].state)
 
-        if self.state:  # noqa: SIM102
-            # Go depth first to the last state
-            if new_transition := await self.state.get_transition(context=context):
-                if new_transition.target is not None:
-                    await self.on_exit(context=context)
-                    await self.update_state(target=new_transition.target, context=context)
+        found: Optional[Transition] = None
+        for state in reversed(active):
+            if found is not None and found.target is not None:
+                await state.on_exit(context=context)
+                await state.update_state(target=found.target, context=context)
 
-        for transition in self.transitions:
-            if asyncio.iscoroutinefunction(transition.cond):
-                condition = await transition.cond(context, None)
-            else:
-                condition = transition.cond(context, None)
+            found = None
+            for cond, is_coro, transition in state._transient:
+                condition = (await cond(context, None)) if is_coro else cond(context, None)
+                if condition:
+                    found = transition
+                    break
+
+        return found
+
+    def _get_transition_sync(self, context: dict) -> Optional[Transition]:
+        """Check the conditions for each transition, mirrors `get_transition` for states without coroutines
+
+        :param context: A dictionary that contains the current context of the system
+        :type context: dict
 
-            if condition:
-                return transition
+        :returns: The next transition to take, if a condition is met
+        :rtype: Optional[Transition]
+        """
+        if self.state is None:  # no sub-states are active, so there is nothing to exit on the way up
+            for cond, _, transition in self._transient:
+                if cond(context, None):
+                    return transition
+            return None
+
+        active = [self]
+        while active[-1].state:
+            active.append(active[-1].state)
+
+        found: Optional[Transition] = None
+        for state in reversed(active):
+            if found is not None and found.target is not None:
+                state._on_exit_sync(context=context)
+                state._update_state_sync(target=found.target, context=context)
+
+            found = None
+            for cond, _, transition in state._transient:
+                if cond(context, None):
+                    found = transition
+                    break
+
+        return found
@@ -1,6 +1,6 @@
-from typing import Any, Callable, Dict, List, Optional, Union
-
-from pydantic import BaseModel, validator
+from asyncio import iscoroutinefunction
+from sys import intern
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
 from .exceptions import UnknownAction, UnknownGuard
 
@@ -9,16 +9,16 @@ def ALWAYS(*_: Any) -> bool:
     return True
 
 
-def load_actions(values: List[Union[str, Callable]], funcs: Dict[str, Callable]) -> List[Callable]:
+def load_actions(values: Sequence[Union[str, Callable]], funcs: Dict[str, Callable]) -> Tuple[Callable, ...]:
     """Load all of the actions in the passed values
 
     :param values: values to load
-    :type values: List[Union[str, Callable]]
+    :type values: Sequence[Union[str, Callable]]
     :param funcs: functions to load from
     :type funcs: Dict[str, Callable]
     :raises UnknownAction: when an action can be looked up in the passed in actions
-    :return: list of loaded callable actions
-    :rtype: List[Callable]
+    :return: tuple of loaded callable actions
+    :rtype: Tuple[Callable, ...]
     """
     loaded_actions = []
     for value in values:
@@ -31,10 +31,10 @@ def load_actions(values: List[Union[str, Callable]], funcs: Dict[str, Callable])
         else:
             loaded_actions.append(value)
 
-    return loaded_actions
+    return tuple(loaded_actions)
 
 
-class Transition(BaseModel):
+class Transition:
     """Represents a state transition in a state machine
 
     :param target: The target state to transition to.
@@ -45,55 +45,64 @@ class Transition(BaseModel):
     :param actions: A list of functions or strings that represent the actions to be executed during the transition.
                    If an item is a string, it is assumed to be the name of a function
                    that must be available in the current context.
-    :type actions: List[Union[Callable, str]]
+    :type actions: Sequence[Union[Callable, str]]
     """
 
-    target: Optional[str] = None
+    __slots__ = ("target", "actions", "cond", "_actions", "_cond_is_coro", "_all_sync")
+
+    target: Optional[str]
     """The target state for this transition if the condition is met"""
-    guards: Optional[Dict[str, Callable]]
-    """Possible guards, which are callables"""
-    actions_map: Optional[Dict[str, Callable]] = None
-    """Action map"""
-    actions: List[Callable] = []
+    actions: Tuple[Callable, ...]
     """Action side effects for the machine"""
-    cond: Callable = ALWAYS
+    cond: Callable
     """The condition for the transition"""
-
-    @validator("actions", pre=True)
-    def build_actions(cls: "Transition", value: Union[Callable, List], values: Dict[str, Any]) -> List[Callable]:  # type: ignore[return]
-        """Builds the list of actions to be executed during the transition.
-
-        :param value: A function or a list of functions that represent the actions to be executed during the transition.
-        :type value: Union[Callable, List]
-        :return: A list of functions that represent the actions to be executed during the transition.
-        :rtype: List[Callable]
-        """
-        actions = values.get("actions_map")
-
-        if callable(value):  # a single action value return as a list
-            return [value]
-        elif isinstance(value, str):  # string callable look it up!
-            return load_actions([value], actions)
-        elif actions:
-            return load_actions(value, actions)  # load the list of actions
-
-    @validator("cond", pre=True)
-    def build_cond(cls: "Transition", value: Union[Callable, str], values: Dict[str, Any]) -> Optional[Callable]:  # type: ignore[return]
-        """Builds the cond value for a transition
-
-        :param value: the condition callable / str
-        :type value: Union[Callable, str]
-        :param values: values
-        :type values: Dict[str, Any]
-        :return: Callable
-        :rtype: Callable
+    _actions: Tuple[Tuple[Callable, bool], ...]
+    """The actions paired with whether they are coroutine functions"""
+    _cond_is_coro: bool
+    """Whether the condition is a coroutine function"""
+    _all_sync: bool
+    """Whether the condition and all of the actions are plain functions"""
+
+    def __init__(
+        self, target: Optional[str] = None, actions: Optional[Sequence[Callable]] = None, cond: Callable = ALWAYS
+    ) -> None:
+        self.target = target
+        self.actions = tuple(actions) if actions is not None else ()
+        self.cond = cond
+        self._actions = tuple((action, iscoroutinefunction(action)) for action in self.actions)
+        self._cond_is_coro = iscoroutinefunction(cond)
+        self._all_sync = not self._cond_is_coro and not any(is_coro for _, is_coro in self._actions)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "Transition":
+        """Builds a transition from its configuration
+
+        :param config: The normalized transition configuration, with a list of resolved `actions`, a resolved `cond`
+                       and an optional `target`
+        :type config: Dict[str, Any]
+        :return: The built transition
+        :rtype: Transition
         """
-        guards = values.get("guards")
-        if callable(value):
-            return value
-        elif isinstance(value, str) and guards is not None:
-            guard = guards.get(value)
-            if guard is None:
-                raise UnknownGuard(f"Unknown action '{value} - expected one of: {', '.join(guards.keys())}'")
-            elif callable(guard):
-                return guard  # type: ignore[no-any-return]
+        target = config.get("target")
+        return cls(
+            target=intern(target) if target is not None else None, actions=config["actions"], cond=config["cond"]
+        )
+
+
+def build_cond(value: Union[Callable, str], guards: Dict[str, Callable]) -> Callable:
+    """Builds the cond value for a transition
+
+    :param value: the condition callable / str
+    :type value: Union[Callable, str]
+    :param guards: guards to load a named condition from
+    :type guards: Dict[str, Callable]
+    :raises UnknownGuard: when the condition can not be found in the guards
+    :return: Callable
+    :rtype: Callable
+    """
+    if callable(value):
+        return value
+    guard = guards.get(value)
+    if guard is None:
+        raise UnknownGuard(f"Unknown guard '{value} - expected one of: {', '.join(guards.keys())}'")
+    return guard
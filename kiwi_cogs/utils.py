@@ -1,17 +1,183 @@
-from typing import Tuple
+from asyncio import iscoroutinefunction
+from collections.abc import Coroutine
+from functools import lru_cache
+from logging import INFO, Logger
+from operator import itemgetter
+from sys import intern
+from typing import Any, Awaitable, Callable, Dict, Generator, Iterable, Optional, Sequence, Tuple
 
+from .exceptions import SyncUnsupported
 
+
+def noop(*_: Any, **__: Any) -> None:
+    """Accepts any arguments and does nothing"""
+
+
+async def anoop(*_: Any, **__: Any) -> None:
+    """Accepts any arguments and does nothing, as a coroutine function"""
+
+
+class Done(Coroutine):
+    """An already completed coroutine, awaiting it returns the value without suspending
+
+    It is a `collections.abc.Coroutine`, so it can be passed to `asyncio.create_task`, `asyncio.run` or
+    `asyncio.gather` like the coroutine it replaces. It holds no state of its own and can be awaited any number of
+    times.
+    """
+
+    __slots__ = ("value",)
+
+    value: Any
+    """The value returned when awaited"""
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self.value
+        yield  # makes this a generator, it never suspends
+
+    def send(self, _: Any) -> Any:
+        raise StopIteration(self.value)
+
+    def throw(self, typ: Any, val: Any = None, tb: Any = None) -> Any:
+        exception = (typ() if isinstance(typ, type) else typ) if val is None else val
+        raise exception.with_traceback(tb) if tb is not None else exception
+
+    def close(self) -> None:
+        pass
+
+
+def bind_info(logger: Logger) -> Callable[..., None]:
+    """Returns the info method of the logger, or a no-op if INFO is not enabled
+
+    :param logger: The logger to bind
+    :type logger: Logger
+
+    :returns: A callable with the signature of `Logger.info`
+    :rtype: Callable[..., None]
+    """
+    if logger.isEnabledFor(INFO):
+        return logger.info
+    return noop
+
+
+@lru_cache(maxsize=256)
 def parse_target(target: str) -> Tuple[str, str]:
     """Parses a target path, providing the first item & remaining path
 
+    Leading dots are ignored, when there is no remaining path the first item is returned in its place.
+    Targets come from the static machine configuration, so results are cached.
+
     :param target: The target for the transition
     :returns: Tuple[str, str]
     """
-    target_state = None
-    remainder = None
-    while not target_state:
-        values = target.split(".", maxsplit=1)
-        target_state = values[0]
-        target = remainder = values[-1]
-
-    return target_state, remainder
+    target_state, _, remainder = target.lstrip(".").partition(".")
+    return intern(target_state), intern(remainder or target_state)
+
+
+def split_target(target: str) -> Tuple[str, ...]:
+    """Splits a target path into the names of the states it passes through
+
+    Consumes the path the same way a transition does, one `parse_target` step at a time.
+
+    :param target: The target for the transition
+    :returns: Tuple[str, ...]
+    """
+    target_state, remainder = parse_target(target)
+    names = [target_state]
+    while remainder and remainder != target_state:
+        target_state, remainder = parse_target(remainder)
+        names.append(target_state)
+    return tuple(names)
+
+
+def _requires_await(*_: Any, **__: Any) -> None:
+    raise SyncUnsupported("Coroutine functions can not be called without awaiting")
+
+
+def _as_coroutine_function(function: Callable[[Any], None]) -> Callable[[Any], Awaitable[None]]:
+    async def wrapper(context: Any) -> None:
+        function(context)
+
+    return wrapper
+
+
+def compile_callables(
+    callables: Tuple[Callable, ...], name: str, cache: Optional[Dict[Any, Tuple[Callable, Callable]]] = None
+) -> Tuple[Callable[[Any], Awaitable[None]], Callable[[Any], None]]:
+    """Compiles a sequence of callables into functions that call each of them in turn with the context
+
+    The coroutine function awaits only the coroutine functions, the plain function must only be used when none of
+    them are coroutine functions. At most one function is generated: no callables share module level no-ops, a
+    single callable is used as is, and without coroutine functions the coroutine function wraps the plain one.
+
+    :param callables: The callables to call, in order
+    :type callables: Tuple[Callable, ...]
+    :param name: The name of the compiled function
+    :type name: str
+    :param cache: Previously compiled functions keyed by their callables and name
+    :type cache: Optional[Dict[Any, Tuple[Callable, Callable]]]
+
+    :returns: The coroutine function and the plain function taking the context
+    :rtype: Tuple[Callable, Callable]
+    """
+    if not callables:
+        return anoop, noop
+
+    key = (callables, name)
+    if cache is not None:
+        try:
+            compiled = cache.get(key)
+        except TypeError:  # an unhashable callable, it is compiled without the cache
+            cache = None
+        else:
+            if compiled is not None:
+                return compiled
+
+    asynchronous = any(iscoroutinefunction(func) for func in callables)
+    if len(callables) == 1:
+        function = callables[0]
+    else:
+        namespace = {f"_f{index}": func for index, func in enumerate(callables)}
+        lines = [f"{'async ' if asynchronous else ''}def {name}(context):"]
+        for index, func in enumerate(callables):
+            prefix = "await " if asynchronous and iscoroutinefunction(func) else ""
+            lines.append(f"    {prefix}_f{index}(context)")
+        exec("\n".join(lines), namespace)  # noqa: S102
+        function = namespace[name]
+
+    compiled = (function, _requires_await) if asynchronous else (_as_coroutine_function(function), function)
+    if cache is not None:
+        cache[key] = compiled
+    return compiled
+
+
+def tabulate_guard(guard: Callable, keys: Sequence[str], domain: Iterable[Tuple]) -> Callable:
+    """Precomputes a guard over a finite domain of context values, replacing its checks with a single lookup
+
+    The guard must be a plain function that only depends on the given keys of the context, which must all be
+    present in the context. Contexts with values outside of the domain fall back to calling the guard.
+
+    :param guard: The guard to tabulate
+    :type guard: Callable
+    :param keys: The keys of the context the guard depends on
+    :type keys: Sequence[str]
+    :param domain: The tuples of values to precompute, one value per key
+    :type domain: Iterable[Tuple]
+
+    :returns: A guard with the same result as the passed in guard
+    :rtype: Callable
+    """
+    getter = itemgetter(*keys)
+    table: Dict[Any, bool] = {}
+    for values in domain:
+        context = dict(zip(keys, values))
+        table[getter(context)] = bool(guard(context, None))
+
+    def tabulated(context: dict, event: Any) -> bool:
+        result = table.get(getter(context))
+        return bool(guard(context, event)) if result is None else result
+
+    tabulated.__name__ = getattr(guard, "__name__", tabulated.__name__)
+    return tabulated
@@ -20,7 +20,7 @@ async def award_points(context, _):
     context["points"] = 100
 
 
-@fixture
+@fixture(scope="module")
 def game_config() -> dict:
     return {
         "name": "game",
@@ -50,11 +50,40 @@ def game_config() -> dict:
 
 
 @fixture
-async def async_game_machine(game_config) -> Machine:
-    return await Machine.create(game_config)
+async def async_game_machine(game_config, machine_factory) -> Machine:
+    return await machine_factory(game_config)
 
 
 async def test_async_machine(async_game_machine: Machine):
     assert async_game_machine.initial_state.value == "playing"
     await async_game_machine.event("AWARD_POINTS")
     assert async_game_machine.state.value == "win"
+
+
+@fixture
+def async_event_cond_config() -> dict:
+    return {
+        "name": "game",
+        "initial": "playing",
+        "context": {"points": 0},
+        "states": {
+            "playing": {
+                "events": {
+                    "AWARD_POINTS": {"actions": award_points},
+                    "DECLARE_WIN": [
+                        {"target": "lose", "cond": has_player_lost},
+                        {"target": "win", "cond": has_player_won},
+                    ],
+                },
+            },
+            "win": {"type": "final"},
+            "lose": {"type": "final"},
+        },
+    }
+
+
+async def test_async_event_cond(async_event_cond_config):
+    machine = await Machine.create(async_event_cond_config)
+    await machine.event("AWARD_POINTS")
+    await machine.event("DECLARE_WIN")
+    assert machine.state.value == "win"
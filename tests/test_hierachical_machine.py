@@ -1,4 +1,7 @@
-from pytest import fixture
+import json
+from copy import deepcopy
+
+from pytest import fixture, raises
 
 from kiwi_cogs import Machine
 
@@ -11,7 +14,7 @@ def is_running(context, _):
     return context["speed"] > 11
 
 
-@fixture
+@fixture(scope="module")
 def walk_states():
     return {
         "initial": "start",
@@ -29,7 +32,7 @@ def walk_states():
     }
 
 
-@fixture
+@fixture(scope="module")
 def pedestrian_states(walk_states):
     return {
         "initial": "walk",
@@ -42,7 +45,7 @@ def pedestrian_states(walk_states):
     }
 
 
-@fixture
+@fixture(scope="module")
 def crossing_config(pedestrian_states):
     return {
         "name": "light",
@@ -62,8 +65,8 @@ def crossing_config(pedestrian_states):
 
 
 @fixture
-async def crossing(crossing_config: dict) -> Machine:
-    return await Machine.create(crossing_config)
+async def crossing(crossing_config: dict, machine_factory) -> Machine:
+    return await machine_factory(crossing_config)
 
 
 async def test_crossing(crossing: Machine):
@@ -90,3 +93,55 @@ async def test_crossing(crossing: Machine):
     assert crossing.state.value == {"red": {"walk": "walking"}}
     await crossing.event("POWER_CROSSED")
     assert crossing.state.value == {"red": {"walk": "crossed"}}
+
+
+async def test_crossing_states_are_reused(crossing: Machine):
+    green = crossing.state
+    assert green is crossing.initial_state is crossing.states["green"]
+    await crossing.trigger_events(["TIMER", "TIMER"])
+    red = crossing.state
+    assert red is crossing.states["red"] and red.state is red.states["walk"]
+    await crossing.event("TIMER")
+    assert crossing.state is green
+    await crossing.event("POWER_RESTORED")
+    assert crossing.state is red and red.state is red.states["walk"]
+
+
+async def test_crossing_value_is_shared(crossing: Machine):
+    await crossing.event("TIMER")
+    await crossing.event("TIMER")
+    value = crossing.state.value
+    assert value == {"red": {"walk": "walking"}}
+    await crossing.event("CROSSED")
+    await crossing.event("POWER_OUTAGE")
+    await crossing.event("POWER_RESTORED")
+    assert crossing.state.value is value
+    with raises(TypeError):
+        value["red"] = "stop"
+    assert deepcopy(crossing).state.value == value
+
+
+async def test_crossing_plain_value(crossing: Machine):
+    assert crossing.state.plain_value == "green"
+    await crossing.trigger_events(["TIMER", "TIMER"])
+    value = crossing.state.plain_value
+    assert type(value) is dict and type(value["red"]) is dict
+    assert json.loads(json.dumps(value)) == {"red": {"walk": "walking"}}
+    assert crossing.state.plain_value is not value
+
+
+async def test_crossing_build_order(crossing: Machine):
+    red = crossing.states["red"]
+    assert [state.name for state in red.walk()] == [
+        "red",
+        "walk",
+        "start",
+        "walking",
+        "running",
+        "crossed",
+        "wait",
+        "stop",
+        "blinking",
+    ]
+    assert list(red.states["walk"].states) == ["start", "walking", "running", "crossed"]
+    assert red.states["walk"].states["walking"].parent == ".red.walk"
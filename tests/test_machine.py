@@ -1,11 +1,12 @@
 import asyncio
+import threading
 
-from pytest import fixture, raises
+from pytest import fixture, raises, warns
 
-from kiwi_cogs import Machine, UnknownAction, UnknownGuard, UnknownTarget
+from kiwi_cogs import Machine, SyncUnsupported, UnknownAction, UnknownGuard, UnknownTarget, slotted_context
 
 
-@fixture
+@fixture(scope="module")
 def traffic_light_config() -> dict:
     return {
         "name": "lights",
@@ -52,7 +53,7 @@ def age_determined(context):
     print(f"Users age has been determined as: {age}")
 
 
-@fixture
+@fixture(scope="module")
 def transient_config() -> dict:
     return {
         "name": "age",
@@ -164,7 +165,7 @@ async def do_something_else(context, _):
     await asyncio.sleep(0)
 
 
-@fixture
+@fixture(scope="module")
 def simple_game_config() -> dict:
     return {
         "name": "game",
@@ -194,23 +195,18 @@ def simple_game_config() -> dict:
 
 
 @fixture
-async def traffic_light(traffic_light_config) -> Machine:
-    return await Machine.create(traffic_light_config)
+async def traffic_light(traffic_light_config, machine_factory) -> Machine:
+    return await machine_factory(traffic_light_config)
 
 
 @fixture
-async def age_machine(transient_config) -> Machine:
-    return await Machine.create(transient_config)
+async def age_machine(transient_config, machine_factory) -> Machine:
+    return await machine_factory(transient_config)
 
 
 @fixture
-async def game_machine(simple_game_config) -> Machine:
-    return await Machine.create(simple_game_config)
-
-
-@fixture
-async def bad_transient_machine(bad_transient_config) -> Machine:
-    return await Machine.create(bad_transient_config)
+async def game_machine(simple_game_config, machine_factory) -> Machine:
+    return await machine_factory(simple_game_config)
 
 
 def test_machine_configuration(traffic_light: Machine):
@@ -235,10 +231,109 @@ async def test_machine(traffic_light: Machine):
     assert green_state.value == "green"
 
 
+def test_machine_event_sync(traffic_light: Machine):
+    assert traffic_light.event_sync("NEXT").value == "yellow"
+    assert traffic_light.event_sync("NEXT").value == "red"
+    assert traffic_light.event_sync("NEXT").value == "green"
+
+
+def test_machine_trigger_events_sync(traffic_light: Machine):
+    assert traffic_light.trigger_events_sync(["NEXT", "NEXT"]).value == "red"
+    assert traffic_light.trigger_events_sync(iter(["NEXT"])).value == "green"
+
+
+async def test_machine_event_without_coroutines(traffic_light: Machine):
+    pending = traffic_light.event("NEXT")
+    assert traffic_light.state.value == "yellow"  # executed without awaiting
+    assert (await pending).value == "yellow"
+    assert (await traffic_light.aevent("NEXT")).value == "red"
+
+
+async def test_machine_event_is_a_coroutine(traffic_light: Machine):
+    assert (await asyncio.create_task(traffic_light.event("NEXT"))).value == "yellow"
+    states = await asyncio.gather(traffic_light.event("NEXT"), traffic_light.event("NEXT"))
+    assert [state.value for state in states] == ["red", "green"]
+
+
+def test_machine_event_run(traffic_light: Machine):
+    assert asyncio.run(traffic_light.event("NEXT")).value == "yellow"
+
+
+def test_machine_single_guarded_transition_sync():
+    machine = Machine.from_config(
+        {
+            "name": "door",
+            "initial": "closed",
+            "states": {"closed": {"events": {"OPEN": {"target": "open", "cond": "unlocked"}}}, "open": {}},
+            "guards": {"unlocked": lambda context, event: not context["locked"]},
+            "context": {"locked": True},
+        }
+    )
+    assert machine.event_sync("OPEN").value == "closed"
+    machine.context["locked"] = False
+    assert machine.event_sync("OPEN").value == "open"
+
+
+async def test_event_sync_unsupported(age_machine: Machine):
+    with raises(SyncUnsupported):
+        age_machine.event_sync("GO")
+    with raises(SyncUnsupported):
+        age_machine.trigger_events_sync(["GO"])
+
+
 def test_machine_initial_state(traffic_light: Machine):
     assert traffic_light.initial_state.value == "green"
 
 
+async def test_root_events_take_precedence(traffic_light_config):
+    config = {**traffic_light_config, "events": {"NEXT": {"target": "red"}}}
+    machine = await Machine.create(config)
+    await machine.event("NEXT")
+    assert machine.state.value == "red"
+
+
+async def test_spawn_shares_static_structure(simple_game_config):
+    template = await Machine.create(simple_game_config)
+    await template.event("AWARD_POINTS")  # spawned machines start as the template was created
+    first, second = await template.spawn(), await template.spawn()
+    assert first.state.value == "playing"
+    assert first.state is not second.state
+    assert first.context is not second.context
+    assert first.state.events["AWARD_POINTS"] is second.state.events["AWARD_POINTS"]
+    await first.event("AWARD_POINTS")
+    assert first.state.value == "win"
+    assert second.state.value == "playing"
+    assert second.context == {"points": 0}
+
+
+async def test_spawn_context_with_lock(simple_game_config):
+    lock = threading.Lock()
+    template = await Machine.create({**simple_game_config, "context": slotted_context({"points": 0, "lock": lock})})
+    await template.event("AWARD_POINTS")
+    machine = await template.spawn()
+    assert type(machine.context) is type(template.context)
+    assert machine.context["lock"] is lock  # locks can not be copied, they are shared
+    assert machine.context["points"] == 0
+    assert template.context["points"] == 100
+
+
+async def test_entry_and_exit_compiled_once(traffic_light: Machine, age_machine: Machine):
+    green = traffic_light.states["green"]
+    assert green._entry_sync is green._exit_sync  # a shared no-op, nothing is compiled
+    adult, child = age_machine.states["adult"], age_machine.states["child"]
+    assert adult._entry is child._entry
+    with raises(SyncUnsupported):
+        age_machine.states["unknown"]._entry_sync(age_machine.context)
+
+
+async def test_machine_factory_copies(traffic_light_config, machine_factory):
+    first = await machine_factory(traffic_light_config)
+    await first.event("NEXT")
+    second = await machine_factory(traffic_light_config)
+    assert first.state.value == "yellow"
+    assert second.state.value == "green"
+
+
 async def test_transient_machine_adult(age_machine: Machine):
     assert age_machine.state.value == "unknown"
     context = {"age": 18}
@@ -259,9 +354,69 @@ async def test_game_machine(game_machine: Machine):
     assert game_machine.state.value == "win"
 
 
-async def test_bad_transient_transitions(bad_transient_machine):
+async def test_config_not_modified(transient_config):
+    await Machine.create(transient_config)
+    assert transient_config["states"]["unknown"]["exit"] is age_determined
+    assert "events" not in transient_config["states"]["adult"]
+
+
+async def test_machine_from_raw_config_is_deprecated(traffic_light_config):
+    with warns(DeprecationWarning):
+        machine = Machine(**traffic_light_config)
+    assert machine.state.value == "green"
+    assert (await machine.event("NEXT")).value == "yellow"
+
+
+async def test_reset(game_machine: Machine):
+    context = game_machine.context
+    await game_machine.event("AWARD_POINTS")
+    assert game_machine.state.value == "win"
+    state = await game_machine.reset()
+    assert state.value == "playing"
+    assert game_machine.context is context
+    assert context == {"points": 0}
+
+
+async def test_bad_transient_transitions(bad_transient_config):
     with raises(UnknownTarget):
-        await bad_transient_machine.event("GO")
+        await Machine.create(bad_transient_config)
+
+
+async def test_slotted_context(simple_game_config):
+    context = slotted_context({"points": 0})
+    machine = await Machine.create({**simple_game_config, "context": context})
+    assert machine.context is not context
+    assert machine.context.points == 0
+    await machine.event("AWARD_POINTS")
+    assert machine.state.value == "win"
+    assert machine.context.points == 100
+    assert context["points"] == 0
+    with raises(KeyError):
+        machine.context["unknown"] = 1
+
+
+def test_slotted_context_attributes_are_not_keys():
+    context = slotted_context({"total": 0})
+    assert "keys" not in context and "total" in context
+    assert context.get("update", 0) == 0 and context.get("total") == 0
+    for key in ("values", "__class__", "unknown"):
+        with raises(KeyError):
+            context[key]
+        with raises(KeyError):
+            context[key] = 1
+        with raises(KeyError):
+            del context[key]
+    del context["total"]
+    assert "total" not in context and context.get("total") is None and dict(context) == {}
+    with raises(KeyError):
+        context["total"]
+    assert type(context).__module__ == "kiwi_cogs.context"
+
+
+def test_slotted_context_invalid_keys():
+    for key in ("items", "get", "update", "clear", "not-an-identifier", "class", 1):
+        with raises(ValueError, match=repr(key)):
+            slotted_context({key: [], "total": 0})
 
 
 async def test_update_config(game_machine: Machine):
@@ -312,11 +467,71 @@ async def test_event_multi_transition_events(multi_transition_event_machine: Mac
     assert multi_transition_event_machine.state.type == "final"
 
 
+async def test_action_receives_event_name(multi_transition_event):
+    received = []
+    multi_transition_event["states"]["playing"]["events"]["AWARD_POINTS"] = {
+        "actions": lambda _, event: received.append(event)
+    }
+    machine = await Machine.create(multi_transition_event)
+    await machine.event("AWARD_POINTS")
+    assert received == ["AWARD_POINTS"]
+
+
 async def test_bad_action_config(bad_action_config):
     with raises(UnknownAction):
         await Machine.create(bad_action_config)
 
 
+def log_event(context, event):
+    context["log"].append(event)
+
+
+async def test_reset_mutable_context():
+    config = {
+        "name": "log",
+        "initial": "idle",
+        "context": {"log": []},
+        "states": {"idle": {"events": {"GO": {"target": "done", "actions": log_event}}}, "done": {}},
+    }
+    machine = await Machine.create(config)
+    await machine.event("GO")
+    assert machine.context == {"log": ["GO"]}
+    await machine.reset()
+    assert machine.context == {"log": []}
+    await machine.event("GO")
+    await machine.reset()
+    assert machine.context == {"log": []}
+
+
+async def test_reset_keeps_user_context(simple_game_config):
+    machine = await Machine.create({**simple_game_config, "context": slotted_context({"points": 0})})
+    context = machine.context
+    await machine.event("AWARD_POINTS")
+    await machine.reset()
+    assert machine.context is context  # the machine's own context is restored in place
+    user_context = {"points": 50}
+    await machine.with_context(user_context)
+    await machine.reset()
+    assert user_context == {"points": 50}
+    assert type(machine.context) is type(context)
+    assert machine.context == {"points": 0}
+
+
+async def test_named_entry_actions(traffic_light_config):
+    entered = []
+    config = {
+        **traffic_light_config,
+        "states": {**traffic_light_config["states"], "yellow": {"entry": "logEntry", "events": {}}},
+        "actions": {"logEntry": entered.append},
+    }
+    machine = await Machine.create(config)
+    await machine.event("NEXT")
+    assert len(entered) == 1
+
+    with raises(UnknownAction):
+        await Machine.create({**config, "actions": {}})
+
+
 async def test_bad_cond_config(bad_guard_config):
     with raises(UnknownGuard):
         await Machine.create(bad_guard_config)
@@ -0,0 +1,25 @@
+import asyncio
+import sys
+from types import ModuleType
+
+from kiwi_cogs import install_uvloop
+
+
+def test_install_uvloop_unavailable(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert install_uvloop() is False
+
+
+def test_install_uvloop_sets_policy(monkeypatch):
+    class EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+    uvloop = ModuleType("uvloop")
+    uvloop.EventLoopPolicy = EventLoopPolicy
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+    policy = asyncio.get_event_loop_policy()
+    try:
+        assert install_uvloop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), EventLoopPolicy)
+    finally:
+        asyncio.set_event_loop_policy(policy)
@@ -1,6 +1,8 @@
+from itertools import product
+
 from pytest import fixture
 
-from kiwi_cogs import Machine
+from kiwi_cogs import Machine, tabulate_guard
 
 
 def check_if_score_is_deuce(context, _):
@@ -24,10 +26,8 @@ def check_if_score_is_advantage(context, _):
     :returns: True if the score is advantage for one player, False otherwise
     :rtype: bool
     """
-    if context["player1_score"] > context["player2_score"]:
-        return context["player1_score"] >= 4 and context["player1_score"] - context["player2_score"] == 1
-    else:
-        return context["player2_score"] >= 4 and context["player2_score"] - context["player1_score"] == 1
+    player1, player2 = context["player1_score"], context["player2_score"]
+    return max(player1, player2) >= 4 and abs(player1 - player2) == 1
 
 
 def check_if_score_is_game(context, _):
@@ -39,10 +39,15 @@ def check_if_score_is_game(context, _):
     :returns: True if the score is a game for one player, False otherwise
     :rtype: bool
     """
-    if context["player1_score"] > context["player2_score"]:
-        return context["player1_score"] >= 4 and context["player1_score"] - context["player2_score"] >= 2
-    else:
-        return context["player2_score"] >= 4 and context["player2_score"] - context["player1_score"] >= 2
+    player1, player2 = context["player1_score"], context["player2_score"]
+    return max(player1, player2) >= 4 and abs(player1 - player2) >= 2
+
+
+SCORES = ("player1_score", "player2_score")
+SCORE_DOMAIN = list(product(range(8), repeat=2))
+is_deuce = tabulate_guard(check_if_score_is_deuce, SCORES, SCORE_DOMAIN)
+is_advantage = tabulate_guard(check_if_score_is_advantage, SCORES, SCORE_DOMAIN)
+is_game = tabulate_guard(check_if_score_is_game, SCORES, SCORE_DOMAIN)
 
 
 def increment_player1_score(context, _):
@@ -53,7 +58,7 @@ def increment_player2_score(context, _):
     context["player2_score"] += 1
 
 
-@fixture
+@fixture(scope="module")
 def tennis_config():
     return {
         "name": "tennis_game",
@@ -106,8 +111,8 @@ def tennis_config():
 
 
 @fixture
-async def tennis_machine(tennis_config):
-    return await Machine.create(tennis_config)
+async def tennis_machine(tennis_config, machine_factory) -> Machine:
+    return await machine_factory(tennis_config)
 
 
 async def test_tennis_deuce(tennis_machine):
@@ -148,3 +153,40 @@ async def test_tennis_game(tennis_machine):
     await tennis_machine.event("PLAYER1_SCORES")
     await tennis_machine.event("PLAYER1_SCORES")
     assert tennis_machine.state.value == "game"
+
+
+async def test_tennis_trigger_events(tennis_machine):
+    state = await tennis_machine.trigger_events(["PLAYER2_SCORES", "PLAYER1_SCORES"] * 4 + ["PLAYER1_SCORES"] * 2)
+    assert state.value == "game"
+
+
+def test_tabulated_guards():
+    for scores in product(range(10), repeat=2):
+        context = dict(zip(SCORES, scores))
+        assert is_deuce(context, None) == check_if_score_is_deuce(context, None)
+        assert is_advantage(context, None) == check_if_score_is_advantage(context, None)
+        assert is_game(context, None) == check_if_score_is_game(context, None)
+
+
+async def test_tennis_tabulated_guards(tennis_config):
+    tabulated = {
+        check_if_score_is_deuce: is_deuce,
+        check_if_score_is_advantage: is_advantage,
+        check_if_score_is_game: is_game,
+    }
+    states = {
+        name: {**state, "transitions": [{**t, "cond": tabulated[t["cond"]]} for t in state.get("transitions", [])]}
+        for name, state in tennis_config["states"].items()
+    }
+    machine = await Machine.create({**tennis_config, "states": states})
+    assert (await machine.trigger_events(["PLAYER2_SCORES", "PLAYER1_SCORES"] * 3)).value == "deuce"
+    assert (await machine.event("PLAYER1_SCORES")).value == "advantage"
+    assert (await machine.event("PLAYER1_SCORES")).value == "game"
+
+
+async def test_identical_events_are_shared(tennis_machine):
+    serving, deuce, advantage = (tennis_machine.states[name] for name in ("serving", "deuce", "advantage"))
+    assert serving.events["PLAYER1_SCORES"] is deuce.events["PLAYER1_SCORES"] is advantage.events["PLAYER1_SCORES"]
+    assert serving.events["PLAYER1_SCORES"] is not serving.events["PLAYER2_SCORES"]
+    state = await tennis_machine.trigger_events(["PLAYER1_SCORES"] * 4)
+    assert state.name == "game"
@@ -21,7 +21,7 @@ def lock_turnstile(context, _):
     context["coin_inserted"] = False
 
 
-@fixture
+@fixture(scope="module")
 def turnstile_config():
     return {
         "name": "turnstile",
@@ -46,8 +46,8 @@ def turnstile_config():
 
 
 @fixture
-async def turnstile(turnstile_config) -> Machine:
-    return await Machine.create(turnstile_config)
+async def turnstile(turnstile_config, machine_factory) -> Machine:
+    return await machine_factory(turnstile_config)
 
 
 async def test_turnstile(turnstile: Machine):